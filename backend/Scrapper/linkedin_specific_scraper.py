@@ -4,16 +4,32 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import re
 import json
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
 import sys
 import os
 import logging
 import contextlib
+import atexit
+import html
+import shutil
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# orjson is optional; the stdlib json module covers the same calls more slowly
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Suppress all warnings and logs completely
 os.environ['WDM_LOG_LEVEL'] = '0'
@@ -22,95 +38,315 @@ logging.getLogger('urllib3').setLevel(logging.CRITICAL)
 logging.getLogger('selenium').setLevel(logging.CRITICAL)
 logging.getLogger('webdriver_manager').setLevel(logging.CRITICAL)
 
+# One devnull for the whole process instead of reopening it per use
+_DEVNULL = open(os.devnull, "w")
+atexit.register(_DEVNULL.close)
+
 @contextlib.contextmanager
 def suppress_all_output():
-    with open(os.devnull, "w") as devnull:
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        try:
-            sys.stdout = devnull
-            sys.stderr = devnull
-            yield
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+    # Redirect the file descriptors as well as sys.stdout/sys.stderr, so output
+    # written below Python (chromedriver, Chrome) is silenced too
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    old_stdout = sys.stdout
+    old_stderr = sys.stderr
+    try:
+        os.dup2(_DEVNULL.fileno(), 1)
+        os.dup2(_DEVNULL.fileno(), 2)
+        sys.stdout = _DEVNULL
+        sys.stderr = _DEVNULL
+        yield
+    finally:
+        sys.stdout = old_stdout
+        sys.stderr = old_stderr
+        os.dup2(saved_fds[0], 1)
+        os.dup2(saved_fds[1], 2)
+        os.close(saved_fds[0])
+        os.close(saved_fds[1])
 
-def scrape_linkedin_advanced(url, company_name):
-    """Advanced LinkedIn scraper with multiple fallback methods"""
+# Precompiled patterns, shared across every club instead of rebuilt per call
+# Tried in order: a follower count wins over a member count wherever each
+# appears in the text
+_FOLLOWER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(\d+(?:,\d+)*)\s*followers?',
+        r'followers?\s*(\d+(?:,\d+)*)',
+        r'(\d+(?:,\d+)*)\s*members?',
+        r'members?\s*(\d+(?:,\d+)*)',
+    )
+]
+_TITLE_FOLLOWER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(\d+(?:,\d+)*)\s*followers?',
+        r'(\d+(?:,\d+)*)\s*members?',
+    )
+]
+# LinkedIn branding removed from descriptions, all three strips in one pass
+_LINKEDIN_BRANDING_RE = re.compile(
+    r'.*?on LinkedIn.*?[.|:]'
+    r'|Sign up.*$'
+    r'|750 million.*?opportunities\.'
+)
+_GENERIC_LI = re.compile(r'manage your professional identity|build and engage|750 million', re.IGNORECASE)
+# Both lists are in priority order: structured JSON data beats page text
+# even when the text comes first in the page
+_SELENIUM_FOLLOWER_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'"followerCount[^"]*":\s*(\d+)',
+        r'"numberOfEmployees[^"]*":\s*"([^"]*)"',
+        r'followers?\D*(\d+(?:,\d+)*)',
+        r'(\d+(?:,\d+)*)\D*followers?',
+    )
+]
+_DESCRIPTION_PATTERNS = [
+    re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+        r'"description":\s*"([^"]{30,})"',
+        r'"about":\s*"([^"]{30,})"',
+        r'<meta[^>]*property="og:description"[^>]*content="([^"]{30,})"',
+        r'<meta[^>]*name="description"[^>]*content="([^"]{30,})"',
+    )
+]
+_DESC_CLEANUP_NL = re.compile(r'\\n')
+_DESC_CLEANUP_WS = re.compile(r'\s+')
+_META_DESC_RE = re.compile(rb'<meta[^>]*(?:name="description"|property="og:description")[^>]*content="([^"]*)"', re.IGNORECASE)
+_TITLE_RE = re.compile(rb'<title[^>]*>([^<]*)</title>', re.IGNORECASE)
+_HEAD_END_RE = re.compile(rb'</head>', re.IGNORECASE)
+_HEAD_LIMIT = 64 * 1024
+
+def _first_group(patterns, text, default="N/A"):
+    # Group 1 of the first pattern that matches, in priority order
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return default
+
+# requests-cache is optional; without it every run goes to the network
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Shared keep-alive session so repeated hits on the same host reuse one connection.
+# With requests-cache installed, re-runs within the hour are served from the same
+# on-disk sqlite cache the main scraper uses, next to both scripts
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_cache'),
+        backend='sqlite',
+        expire_after=3600,
+        allowable_codes=(200, 301, 404)
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.7258.155 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # Adds 'br' whenever brotli/brotlicffi is installed to decode it
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+# The fallback parser only builds the tags it is asked about
+_META_STRAINER = SoupStrainer(['title', 'meta'])
+
+# selectolax parses with a C engine; BeautifulSoup stays as the fallback
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+def _extract_head(content):
+    """Return the page title and meta description (None when missing)"""
+    # Fast path: pull both straight out of the raw bytes without building a tree
+    desc_match = _META_DESC_RE.search(content)
+    if desc_match:
+        title_match = _TITLE_RE.search(content)
+        return (
+            html.unescape(title_match.group(1).decode('utf-8', 'replace')) if title_match else None,
+            html.unescape(desc_match.group(1).decode('utf-8', 'replace'))
+        )
     
-    # Method 1: Try direct requests first (fastest)
-    def try_requests_method():
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.7258.155 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
+    # Unusual markup (e.g. content before name) still goes through a parser
+    if HTMLParser is not None:
+        tree = HTMLParser(content)
+        title = tree.css_first('title')
+        description = tree.css_first('meta[name="description"], meta[property="og:description"]')
+        return (
+            title.text() if title else None,
+            description.attributes.get('content') or '' if description else None
+        )
+    
+    soup = BeautifulSoup(content, 'lxml', parse_only=_META_STRAINER)
+    title = soup.find('title')
+    description = soup.select_one('meta[name="description"], meta[property="og:description"]')
+    return (
+        title.text if title else None,
+        description.get('content', '') if description else None
+    )
+
+# Minimum gap between two requests to the same host; different hosts never wait
+_MIN_HOST_INTERVAL = 1.0
+_last_hit = {}
+_host_locks = {}
+
+def _pace(url):
+    host = urlparse(url).netloc
+    with _host_locks.setdefault(host, threading.Lock()):
+        wait = _last_hit.get(host, 0.0) + _MIN_HOST_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_hit[host] = time.monotonic()
+
+def _fetch_head(url):
+    """Download the page only up to </head> (capped at 64 KB)"""
+    buffer = bytearray()
+    response = None
+    if requests_cache is not None:
+        # Fresh cache hits never touch LinkedIn, so they skip the pacing;
+        # misses and expired entries come back as 504 without a request
+        response = _SESSION.get(url, timeout=(3, 10), stream=True, only_if_cached=True)
+        if response.status_code == 504:
+            response.close()
+            response = None
+    if response is None:
+        _pace(url)
+        response = _SESSION.get(url, timeout=(3, 10), stream=True)
+    with response:
+        for chunk in response.iter_content(16384):
+            # Rescan a few bytes of the previous chunk in case the tag straddles both
+            start = max(0, len(buffer) - 6)
+            buffer += chunk
+            if _HEAD_END_RE.search(buffer, start) or len(buffer) >= _HEAD_LIMIT:
+                break
+    return bytes(buffer)
+
+# Method 1: Try direct requests first (fastest)
+def _try_requests_method(url, company_name):
+    try:
+        # The title and meta tags all live in <head>, so stop reading there
+        content = _fetch_head(url)
         
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract from meta tags
-            description = soup.find('meta', {'name': 'description'}) or soup.find('meta', {'property': 'og:description'})
-            title = soup.find('title')
-            
-            followers = "N/A"
-            about_text = "N/A"
+        # Extract from meta tags
+        title, desc_content = _extract_head(content)
+        
+        followers = "N/A"
+        about_text = "N/A"
+        
+        if desc_content is not None:
+            # Look for follower patterns
+            followers = _first_group(_FOLLOWER_PATTERNS, desc_content)
             
-            if description:
-                desc_content = description.get('content', '')
+            # Clean up description
+            if desc_content and len(desc_content) > 30:
+                # Remove LinkedIn branding
+                about_text = _LINKEDIN_BRANDING_RE.sub('', desc_content).strip()
                 
-                # Look for follower patterns
-                follower_patterns = [
-                    r'(\d+(?:,\d+)*)\s*followers?',
-                    r'followers?\s*(\d+(?:,\d+)*)',
-                    r'(\d+(?:,\d+)*)\s*members?',
-                    r'members?\s*(\d+(?:,\d+)*)'
-                ]
-                
-                for pattern in follower_patterns:
-                    match = re.search(pattern, desc_content, re.IGNORECASE)
-                    if match:
-                        followers = match.group(1)
-                        break
-                
-                # Clean up description
-                if desc_content and len(desc_content) > 30:
-                    # Remove LinkedIn branding
-                    about_text = re.sub(r'.*?on LinkedIn.*?[.|:]', '', desc_content)
-                    about_text = re.sub(r'Sign up.*$', '', about_text)
-                    about_text = re.sub(r'750 million.*?opportunities\.', '', about_text)
-                    about_text = about_text.strip()
-                    
-                    # If it's still generic LinkedIn text, mark as N/A
-                    if any(generic in about_text.lower() for generic in ['manage your professional identity', 'build and engage', '750 million']):
-                        about_text = "N/A"
-            
-            # Also check title
-            title_text = title.text if title else ""
-            if followers == "N/A" and title_text:
-                for pattern in [r'(\d+(?:,\d+)*)\s*followers?', r'(\d+(?:,\d+)*)\s*members?']:
-                    match = re.search(pattern, title_text, re.IGNORECASE)
-                    if match:
-                        followers = match.group(1)
-                        break
-            
-            return {
-                "platform": "LinkedIn",
-                "company": company_name,
-                "followers": followers,
-                "about": about_text,
-                "url": url,
-                "method": "requests"
-            }
-            
-        except Exception as e:
-            return None
+                # If it's still generic LinkedIn text, mark as N/A
+                if _GENERIC_LI.search(about_text):
+                    about_text = "N/A"
+        
+        # Also check title
+        title_text = title or ""
+        if followers == "N/A" and title_text:
+            followers = _first_group(_TITLE_FOLLOWER_PATTERNS, title_text)
+        
+        return {
+            "platform": "LinkedIn",
+            "company": company_name,
+            "followers": followers,
+            "about": about_text,
+            "url": url,
+            "method": "requests"
+        }
+        
+    except Exception as e:
+        return None
+
+# Evaluated in the page so only a few hundred bytes come back per club
+_PAGE_READY_JS = (
+    "return !!document.querySelector('meta[name=description]')"
+    " || document.documentElement.innerHTML.includes('followerCount');"
+)
+# aboutCandidates mirrors _DESCRIPTION_PATTERNS: the first JSON "description",
+# then "about", then the og and plain meta descriptions, each at least 30 chars
+_PAGE_SNAPSHOT_JS = """
+const html = document.documentElement.innerHTML;
+const meta = document.querySelector('meta[name=description]')
+    || document.querySelector('meta[property="og:description"]');
+const count = html.match(/"followerCount"\\s*:\\s*(\\d+)/);
+const jsonField = (re) => { const m = html.match(re); return m ? m[1] : null; };
+const metaContent = (selector) => {
+    const el = document.querySelector(selector);
+    return el && el.content && el.content.length >= 30 ? el.content : null;
+};
+return {
+    description: meta ? meta.content : '',
+    title: document.title || '',
+    followerCount: count ? count[1] : null,
+    aboutCandidates: [
+        jsonField(/"description":\\s*"([^"]{30,})"/i),
+        jsonField(/"about":\\s*"([^"]{30,})"/i),
+        metaContent('meta[property="og:description"]'),
+        metaContent('meta[name=description]')
+    ]
+};
+"""
+
+def _find_followers(text):
+    # Look for follower data in JSON-LD or other structured data
+    return _first_group(_SELENIUM_FOLLOWER_PATTERNS, text)
+
+def _clean_about(desc):
+    # Clean up
+    desc = _DESC_CLEANUP_NL.sub(' ', desc)
+    desc = _DESC_CLEANUP_WS.sub(' ', desc)
+    desc = desc.strip()
     
-    # Method 2: Try Selenium with special techniques
-    def try_selenium_method():
+    # Check if it's not generic
+    if len(desc) > 30 and not _GENERIC_LI.search(desc):
+        return desc
+    return None
+
+def _first_about(candidates):
+    # Candidates come in _DESCRIPTION_PATTERNS priority order; the first one
+    # that survives cleanup wins
+    for desc in candidates:
+        if desc:
+            desc = _clean_about(desc)
+            if desc:
+                return desc
+    return "N/A"
+
+# Resolved once per process so later drivers skip webdriver_manager's checks
+_DRIVER_PATH = None
+
+def _driver_path():
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        # An explicit or installed driver skips webdriver-manager's version check
+        _DRIVER_PATH = (
+            os.environ.get('CHROMEDRIVER_PATH')
+            or shutil.which('chromedriver')
+            or ChromeDriverManager().install()
+        )
+    return _DRIVER_PATH
+
+# Method 2: Try Selenium with special techniques
+class LinkedInScraper:
+    """Selenium fallback that keeps one Chrome instance alive across clubs"""
+    
+    def __init__(self):
+        self.driver = None
+    
+    def _start_driver(self):
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -120,60 +356,61 @@ def scrape_linkedin_advanced(url, company_name):
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.7258.155 Safari/537.36")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Only the HTML is scanned, so skip images, stylesheets and fonts
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
+        # Return from driver.get on DOMContentLoaded; the explicit wait below covers the rest
+        chrome_options.page_load_strategy = 'eager'
         
+        with suppress_all_output():
+            service = Service(_driver_path())
+            service.log_path = os.devnull
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+                'urls': ['*.png', '*.jpg', '*.gif', '*.woff*', '*.css', '*.svg', '*.mp4', '*gtm.js*', '*analytics*', '*doubleclick*']
+            })
+            self.driver.execute_cdp_cmd('Network.enable', {})
+    
+    def scrape(self, url, company_name):
         try:
-            with suppress_all_output():
-                service = Service(ChromeDriverManager().install())
-                service.log_path = os.devnull
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            if self.driver is None:
+                self._start_driver()
+            driver = self.driver
             
+            _pace(url)
             driver.get(url)
-            time.sleep(10)  # Give more time for LinkedIn to load
-            
-            followers = "N/A"
-            about = "N/A"
-            
-            # Get page source and search for patterns
-            page_source = driver.page_source
-            
-            # Look for follower data in JSON-LD or other structured data
-            json_patterns = [
-                r'"followerCount[^"]*":\s*(\d+)',
-                r'"numberOfEmployees[^"]*":\s*"([^"]*)"',
-                r'followers?\D*(\d+(?:,\d+)*)',
-                r'(\d+(?:,\d+)*)\D*followers?'
-            ]
-            
-            for pattern in json_patterns:
-                match = re.search(pattern, page_source, re.IGNORECASE)
-                if match:
-                    followers = match.group(1)
-                    break
-            
-            # Look for description in various places
-            description_patterns = [
-                r'"description":\s*"([^"]{30,})"',
-                r'"about":\s*"([^"]{30,})"',
-                r'<meta[^>]*property="og:description"[^>]*content="([^"]{30,})"',
-                r'<meta[^>]*name="description"[^>]*content="([^"]{30,})"'
-            ]
+            try:
+                WebDriverWait(driver, 12).until(lambda d: d.execute_script(_PAGE_READY_JS))
+            except TimeoutException:
+                pass
+            time.sleep(0.3)  # Debounce late JSON hydration
             
-            for pattern in description_patterns:
-                match = re.search(pattern, page_source, re.IGNORECASE | re.DOTALL)
-                if match:
-                    desc = match.group(1)
-                    # Clean up
-                    desc = re.sub(r'\\n', ' ', desc)
-                    desc = re.sub(r'\s+', ' ', desc)
-                    desc = desc.strip()
-                    
-                    # Check if it's not generic
-                    if len(desc) > 30 and not any(generic in desc.lower() for generic in ['manage your professional identity', '750 million', 'build and engage']):
-                        about = desc
-                        break
+            # Pull just the strings we need out of the page rather than
+            # copying the whole serialized DOM across the WebDriver wire
+            try:
+                snapshot = driver.execute_script(_PAGE_SNAPSHOT_JS)
+            except Exception:
+                snapshot = None
             
-            driver.quit()
+            if snapshot is not None:
+                desc = snapshot.get('description') or ''
+                followers = snapshot.get('followerCount') or _find_followers(f"{snapshot.get('title') or ''} {desc}")
+                about = _first_about(snapshot.get('aboutCandidates') or [])
+            else:
+                # Get page source and search for patterns
+                page_source = driver.page_source
+                followers = _find_followers(page_source)
+                
+                # Look for description in various places
+                about = _first_about(
+                    match.group(1)
+                    for match in (pattern.search(page_source) for pattern in _DESCRIPTION_PATTERNS)
+                    if match
+                )
             
             return {
                 "platform": "LinkedIn",
@@ -185,24 +422,25 @@ def scrape_linkedin_advanced(url, company_name):
             }
             
         except Exception as e:
+            # Drop a broken browser so the next club starts a fresh one
+            self.close()
+            return None
+    
+    def close(self):
+        if self.driver is not None:
             try:
-                driver.quit()
+                self.driver.quit()
             except:
                 pass
-            return None
-    
-    # Try methods in order
-    print(f"Scraping LinkedIn for {company_name}...")
-    
-    # Try requests first (faster)
-    result = try_requests_method()
-    if result and (result["followers"] != "N/A" or result["about"] != "N/A"):
-        print(f"  ✓ Success with requests method")
-        return result
-    
+            self.driver = None
+
+def _has_data(result):
+    return result and (result["followers"] != "N/A" or result["about"] != "N/A")
+
+def _selenium_fallback(url, company_name, scraper):
     # If requests didn't work well, try Selenium
-    print(f"  → Trying Selenium method...")
-    result = try_selenium_method()
+    print(f"  → Trying Selenium method for {company_name}...")
+    result = scraper.scrape(url, company_name)
     if result:
         print(f"  ✓ Success with Selenium method")
         return result
@@ -218,43 +456,91 @@ def scrape_linkedin_advanced(url, company_name):
         "method": "failed"
     }
 
+def scrape_linkedin_advanced(url, company_name):
+    """Advanced LinkedIn scraper with multiple fallback methods"""
+    
+    # Try methods in order
+    print(f"Scraping LinkedIn for {company_name}...")
+    
+    # Try requests first (faster)
+    result = _try_requests_method(url, company_name)
+    if _has_data(result):
+        print(f"  ✓ Success with requests method")
+        return result
+    
+    scraper = LinkedInScraper()
+    try:
+        return _selenium_fallback(url, company_name, scraper)
+    finally:
+        scraper.close()
+
+def _fetch_one(club):
+    result = _try_requests_method(club['social_media']['linkedin'], club['name'])
+    return club['id'], result
+
+def _to_json(results):
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(results, indent=2, ensure_ascii=False)
+
 # Test with SNUC clubs
 def main():
     # Load clubs data
     try:
-        with open('../data/clubs.json', 'r', encoding='utf-8') as f:
-            clubs_data = json.load(f)
-            clubs = clubs_data['clubs']
+        with open('../data/clubs.json', 'rb') as f:
+            raw = f.read()
+        clubs_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        clubs = clubs_data['clubs']
     except Exception as e:
         print(f"Error loading clubs data: {e}")
         return
     
-    results = {}
+    linkedin_clubs = [
+        club for club in clubs
+        if 'social_media' in club and 'linkedin' in club['social_media']
+    ]
+    
+    # Fast path: fetch every club's page over the shared Session in parallel,
+    # since the work is almost entirely network wait. Every URL is on
+    # linkedin.com and _pace starts at most one request per second there, so a
+    # few workers cover the requests still in flight; more would only queue in _pace
+    print(f"Fetching {len(linkedin_clubs)} LinkedIn pages...")
+    fetched = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(_fetch_one, club) for club in linkedin_clubs]
+        for future in as_completed(futures):
+            club_id, result = future.result()
+            fetched[club_id] = result
     
-    for club in clubs:
-        if 'social_media' in club and 'linkedin' in club['social_media']:
-            club_name = club['name']
-            linkedin_url = club['social_media']['linkedin']
+    # Slow path: Selenium only for pages the requests method could not read.
+    # Keeps output in clubs.json order regardless of completion order.
+    # One browser is shared by every fallback and only started if needed.
+    results = {}
+    scraper = LinkedInScraper()
+    try:
+        for club in linkedin_clubs:
+            result = fetched.get(club['id'])
+            if not _has_data(result):
+                result = _selenium_fallback(club['social_media']['linkedin'], club['name'], scraper)
             
-            result = scrape_linkedin_advanced(linkedin_url, club_name)
             results[f"club_{club['id']}"] = {
                 "club_id": club['id'],
-                "club_name": club_name,
+                "club_name": club['name'],
                 "linkedin_data": result
             }
-            
-            # Add delay between requests
-            time.sleep(3)
+    finally:
+        scraper.close()
     
     # Print results
     print("\n" + "="*50)
     print("LINKEDIN SCRAPING RESULTS")
     print("="*50)
-    print(json.dumps(results, indent=2, ensure_ascii=False))
+    output = _to_json(results)
+    print(output)
     
     # Save to file
     with open('linkedin_results.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+        f.write(output)
     print(f"\nResults saved to linkedin_results.json")
 
 if __name__ == "__main__":
@@ -1,10 +1,16 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Optional
+import asyncio
 import json
 import os
+import time
 from datetime import datetime
 
+import orjson
+
 from models.club import Club, ClubGroup, ClubRanking
 from services.club_service import ClubService
 from services.grouping_service import ClubGroupingService
@@ -14,26 +20,65 @@ from services.evaluation_service import ClubEvaluationService
 app = FastAPI(
     title="Club Award System",
     description="API for evaluating and ranking college clubs",
+    default_response_class=ORJSONResponse,
 )
 
-# Initialize services
+# Club, group and ranking lists are large, repetitive JSON; compress anything over 1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Added last so it is the outermost layer and answers OPTIONS preflights before
+# anything else runs; max_age lets browsers cache the preflight for a day
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "http://localhost:8501").split(",")
+    if origin.strip()
+]
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
+    allow_methods=["GET"],
+    allow_headers=["*"],
+    max_age=86400,
+)
+
+# Initialize services; they share one ClubService so clubs.json is parsed once
 club_service = ClubService()
-grouping_service = ClubGroupingService()
-evaluation_service = ClubEvaluationService()
+grouping_service = ClubGroupingService(club_service)
+evaluation_service = ClubEvaluationService(club_service, grouping_service)
+
+# The club data only changes when the JSON files are edited, so derived views
+# (groupings, dashboard stats) are recomputed at most once per TTL window.
+# All data is loaded into memory at startup, so plain lookups stay on the event
+# loop; the grouping/ranking computations are CPU-bound and run via
+# asyncio.to_thread so they don't stall other requests
+CACHE_TTL_SECONDS = 60
+_response_cache: Dict[str, tuple] = {}
+
+def _cached(key: str, compute):
+    now = time.monotonic()
+    hit = _response_cache.get(key)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    value = compute()
+    _response_cache[key] = (value, now + CACHE_TTL_SECONDS)
+    return value
+
+# /clubs is read-only, so its JSON is encoded once up front and served as-is,
+# skipping response validation and serialisation on every call
+CLUBS_JSON = orjson.dumps([club.model_dump() for club in club_service.get_all_clubs()])
 
 @app.get("/")
 async def root():
     """Health check endpoint"""
     return {"message": "Club Award System API is running!"}
 
+# The Club models were validated when clubs.json was loaded, so the prebuilt
+# bytes are returned as-is; response_model only documents the schema
 @app.get("/clubs", response_model=List[Club])
 async def get_all_clubs():
     """Get all clubs with their basic information"""
-    try:
-        clubs = club_service.get_all_clubs()
-        return clubs
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching clubs: {str(e)}")
+    return Response(content=CLUBS_JSON, media_type="application/json")
 
 @app.get("/clubs/{club_id}", response_model=Club)
 async def get_club_by_id(club_id: int):
@@ -50,7 +95,7 @@ async def get_club_by_id(club_id: int):
 async def get_club_groups():
     """Get clubs grouped by their activities and purpose"""
     try:
-        groups = grouping_service.group_clubs()
+        groups = await asyncio.to_thread(_cached, "groups", grouping_service.group_clubs)
         return groups
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error grouping clubs: {str(e)}")
@@ -59,7 +104,7 @@ async def get_club_groups():
 async def get_overall_rankings():
     """Get overall club rankings based on evaluation metrics"""
     try:
-        rankings = evaluation_service.get_overall_rankings()
+        rankings = await asyncio.to_thread(evaluation_service.get_overall_rankings)
         return rankings
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating rankings: {str(e)}")
@@ -68,7 +113,7 @@ async def get_overall_rankings():
 async def get_group_rankings(group_name: str):
     """Get rankings within a specific group"""
     try:
-        rankings = evaluation_service.get_group_rankings(group_name)
+        rankings = await asyncio.to_thread(evaluation_service.get_group_rankings, group_name)
         return rankings
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating group rankings: {str(e)}")
@@ -109,22 +154,28 @@ async def get_voting_summary():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching voting summary: {str(e)}")
 
+def _compute_dashboard_stats() -> dict:
+    return {
+        "total_clubs": club_service.count(),
+        "total_groups": len(_cached("groups", grouping_service.group_clubs)),
+        "total_events": evaluation_service.get_total_events_count(),
+        "total_votes": evaluation_service.get_total_votes_count(),
+        "most_active_club": evaluation_service.get_most_active_club(),
+        "recent_events": evaluation_service.get_recent_events()
+    }
+
 @app.get("/dashboard/stats")
 async def get_dashboard_stats():
     """Get comprehensive statistics for the dashboard"""
     try:
-        stats = {
-            "total_clubs": len(club_service.get_all_clubs()),
-            "total_groups": len(grouping_service.group_clubs()),
-            "total_events": evaluation_service.get_total_events_count(),
-            "total_votes": evaluation_service.get_total_votes_count(),
-            "most_active_club": evaluation_service.get_most_active_club(),
-            "recent_events": evaluation_service.get_recent_events()
-        }
+        stats = await asyncio.to_thread(_cached, "dashboard_stats", _compute_dashboard_stats)
         return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching dashboard stats: {str(e)}")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]); several
+    # workers spread the CPU-bound ranking/grouping work across cores
+    workers = int(os.environ.get("WEB_CONCURRENCY", max(2, (os.cpu_count() or 2) - 1)))
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers, loop="auto", http="auto")
@@ -1,11 +1,81 @@
 import re
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
+# orjson is optional; the stdlib json module covers the same calls more slowly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# WhatsApp export line: "dd/mm/yy, hh:mm am - Sender: message"; leading
+# whitespace is allowed so lines don't need stripping first
+MESSAGE_RE = re.compile(r'\s*(\d{1,2}/\d{1,2}/\d{2,4}),?\s*(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)?)\s*-\s*([^:]+):\s*(.*)')
+# The same shape anchored per line of a whole file, with whitespace kept from
+# crossing line breaks, so one finditer pass replaces the per-line loop
+MESSAGE_LINE_RE = re.compile(
+    r'^[^\S\n]*(\d{1,2}/\d{1,2}/\d{2,4}),?[^\S\n]*(\d{1,2}:\d{2}[^\S\n]*(?:am|pm|AM|PM)?)'
+    r'[^\S\n]*-[^\S\n]*([^:\n]+):[^\S\n]*(.*)',
+    re.MULTILINE
+)
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _date_parts(date_str: str) -> Tuple[int, int, int]:
+    # "dd/mm/yy" or "dd/mm/yyyy" -> (year, month, day)
+    day, month, year = date_str.split('/')
+    return (2000 + int(year) if len(year) == 2 else int(year)), int(month), int(day)
+
+def _epoch_minutes(date_str: str) -> Optional[int]:
+    # Minutes since 1970-01-01 at midnight of the given date, computed with
+    # plain integer arithmetic (days-from-civil) so no datetime is built per
+    # message. None for dates datetime() would reject
+    year, month, day = _date_parts(date_str)
+    leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not (1 <= year <= 9999 and 1 <= month <= 12 and
+            1 <= day <= _DAYS_IN_MONTH[month - 1] + (month == 2 and leap)):
+        return None
+    
+    y = year - (month <= 2)
+    era = y // 400
+    year_of_era = y - era * 400
+    day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return (era * 146097 + day_of_era - 719468) * 1440
+
+def _keyword_re(keywords: List[str]) -> re.Pattern:
+    # One alternation per category: a single scan per message instead of one
+    # substring test per keyword. Matched against bodies that are lower-cased
+    # once at parse time, which is cheaper than IGNORECASE on every scan
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+# file path -> ((size, mtime_ns), analysis). Repeat analyses of an unchanged
+# file are served from here; a changed size or mtime replaces the entry
+_analysis_cache: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
+def _cached_analysis(file_path: str) -> Tuple[Optional[Tuple[int, int]], Optional[Dict]]:
+    
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None, None
+    
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _analysis_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return signature, cached[1]
+    return signature, None
+
+def _store_analysis(file_path: str, signature: Optional[Tuple[int, int]], analysis: Dict):
+    
+    # Failed reads come back empty and are retried next time
+    if signature is not None and analysis:
+        _analysis_cache[file_path] = (signature, analysis)
+
 class WhatsAppChatAnalyzer:
     
     
@@ -44,55 +114,83 @@ class WhatsAppChatAnalyzer:
             'Isai_chat.txt': {'id': 5, 'name': 'Isai'},
             'Montage_chat.txt': {'id': 6, 'name': 'Montage'}
         }
+        
+        self.event_re = _keyword_re(self.event_keywords)
+        self.help_re = _keyword_re(self.help_keywords)
+        self.collaboration_re = _keyword_re(self.collaboration_keywords)
+        self.engagement_re = _keyword_re(self.engagement_keywords)
+        # Union of all four categories; a miss here rules out every category
+        self.any_keyword_re = _keyword_re(
+            self.event_keywords + self.help_keywords +
+            self.collaboration_keywords + self.engagement_keywords
+        )
+        # A "question" is anything with a '?' or one of the help-ish words
+        self.question_re = _keyword_re(['?', 'help', 'doubt', 'how'])
     
     def parse_whatsapp_message(self, line: str) -> Optional[Dict]:
         
         # Pattern for WhatsApp message format
-        pattern = r'(\d{1,2}/\d{1,2}/\d{2,4}),?\s*(\d{1,2}:\d{2}\s*(?:am|pm|AM|PM)?)\s*-\s*([^:]+):\s*(.*)'
-        
-        match = re.match(pattern, line.strip())
+        match = MESSAGE_RE.match(line)
         if match:
-            date_str, time_str, sender, message = match.groups()
-            
-            try:
-                # Parse date
-                if '/' in date_str:
-                    parts = date_str.split('/')
-                    if len(parts[2]) == 2:
-                        year = 2000 + int(parts[2])
-                    else:
-                        year = int(parts[2])
-                    
-                    date = datetime(year, int(parts[1]), int(parts[0]))
-                else:
-                    return None
-                
-                return {
-                    'date': date,
-                    'time': time_str.strip(),
-                    'sender': sender.strip(),
-                    'message': message.strip()
-                }
-            except:
-                return None
+            return self._message_from_match(match)
         return None
     
+    def _message_from_match(self, match: re.Match) -> Optional[Dict]:
+        
+        date_str, time_str, sender, message = match.groups()
+        
+        try:
+            # Parse date
+            date = datetime(*_date_parts(date_str))
+            
+            return {
+                'date': date,
+                'time': time_str.strip(),
+                'sender': sender.strip(),
+                'message': message.strip()
+            }
+        except:
+            return None
+    
     def analyze_chat_file(self, file_path: str) -> Dict:
+        
+        signature, analysis = _cached_analysis(file_path)
+        if analysis is None:
+            analysis = self._analyze_chat_file(file_path)
+            _store_analysis(file_path, signature, analysis)
+        # Callers add keys to the result, so hand out a copy of the cached dict
+        return dict(analysis)
+    
+    def _analyze_chat_file(self, file_path: str) -> Dict:
 
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                content = f.read()
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return {}
         
-        messages = []
-        for line in lines:
-            parsed = self.parse_whatsapp_message(line)
-            if parsed:
-                messages.append(parsed)
-        
-        if not messages:
+        # Same count readlines() would give, without building the list
+        total_lines = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+        
+        # Columnar message store: one array per field instead of a dict per message.
+        # Senders are interned to small ints in order of first appearance, and
+        # bodies are stored lower-cased since they're only keyword-matched
+        # Dates are kept as integer minutes since the epoch
+        timestamps = []
+        sender_ids = []
+        bodies = []
+        sender_index = {}
+        for match in MESSAGE_LINE_RE.finditer(content):
+            date_str, _, sender, message = match.groups()
+            minutes = _epoch_minutes(date_str)
+            if minutes is None:
+                continue
+            timestamps.append(minutes)
+            sender_ids.append(sender_index.setdefault(sender.strip(), len(sender_index)))
+            bodies.append(message.strip().lower())
+        
+        if not bodies:
             return {
                 'total_messages': 0,
                 'unique_senders': 0,
@@ -100,35 +198,37 @@ class WhatsAppChatAnalyzer:
                 'engagement_score': 0.0
             }
         
+        dates = np.array(timestamps, dtype=np.int64).astype('datetime64[m]')
+        sender_ids = np.array(sender_ids, dtype=np.int32)
+        sender_names = list(sender_index)
+        
         # Basic statistics
-        total_messages = len(messages)
-        unique_senders = len(set(msg['sender'] for msg in messages))
+        total_messages = len(bodies)
+        unique_senders = len(sender_names)
         
         # Content analysis
-        event_messages = self._count_keyword_messages(messages, self.event_keywords)
-        help_messages = self._count_keyword_messages(messages, self.help_keywords)
-        collab_messages = self._count_keyword_messages(messages, self.collaboration_keywords)
-        engagement_messages = self._count_keyword_messages(messages, self.engagement_keywords)
+        event_messages, help_messages, collab_messages, engagement_messages = \
+            self._count_keyword_messages(bodies)
         
         # Time-based analysis
-        activity_by_month = self._analyze_monthly_activity(messages)
-        activity_by_hour = self._analyze_hourly_activity(messages)
+        activity_by_month = self._analyze_monthly_activity(dates)
+        activity_by_hour = self._analyze_hourly_activity(dates)
         
         # Sender analysis
-        sender_stats = self._analyze_sender_activity(messages)
+        sender_stats = self._analyze_sender_activity(sender_ids, sender_names)
         
         # Calculate engagement score
         engagement_score = self._calculate_engagement_score(
             total_messages, unique_senders, event_messages, 
-            help_messages, engagement_messages, len(lines)
+            help_messages, engagement_messages, total_lines
         )
         
         # Response rate analysis
-        response_patterns = self._analyze_response_patterns(messages)
+        response_patterns = self._analyze_response_patterns(dates, sender_ids, bodies)
         
         return {
             'total_messages': total_messages,
-            'total_lines': len(lines),
+            'total_lines': total_lines,
             'unique_senders': unique_senders,
             'avg_messages_per_sender': total_messages / unique_senders if unique_senders > 0 else 0,
             'content_analysis': {
@@ -145,75 +245,80 @@ class WhatsAppChatAnalyzer:
             'response_patterns': response_patterns,
             'engagement_score': engagement_score,
             'date_range': {
-                'start': min(msg['date'] for msg in messages).isoformat(),
-                'end': max(msg['date'] for msg in messages).isoformat()
+                'start': dates.min().item().isoformat(),
+                'end': dates.max().item().isoformat()
             }
         }
     
-    def _count_keyword_messages(self, messages: List[Dict], keywords: List[str]) -> int:
-        
-        count = 0
-        for msg in messages:
-            message_text = msg['message'].lower()
-            if any(keyword in message_text for keyword in keywords):
-                count += 1
-        return count
-    
-    def _analyze_monthly_activity(self, messages: List[Dict]) -> Dict:
+    def _count_keyword_messages(self, bodies: List[str]) -> Tuple[int, int, int, int]:
         
-        monthly_counts = defaultdict(int)
-        for msg in messages:
-            month_key = msg['date'].strftime('%Y-%m')
-            monthly_counts[month_key] += 1
+        # One scan with the union pattern per message; only the messages it
+        # hits are classified per category (categories can overlap, e.g.
+        # "join"/"joint", so a single alternation can't tell them apart)
+        any_keyword = self.any_keyword_re.search
+        matched = [body for body in bodies if any_keyword(body)]
         
-        return dict(monthly_counts)
+        return tuple(
+            sum(1 for body in matched if keyword_re.search(body))
+            for keyword_re in (self.event_re, self.help_re, self.collaboration_re, self.engagement_re)
+        )
     
-    def _analyze_hourly_activity(self, messages: List[Dict]) -> Dict:
-        
-        hourly_counts = defaultdict(int)
-        for msg in messages:
-            hour = msg['date'].hour
-            hourly_counts[hour] += 1
+    def _analyze_monthly_activity(self, dates: np.ndarray) -> Dict:
+        
+        # Months since epoch, histogrammed from the earliest month: a linear
+        # bincount instead of np.unique's sort
+        months = dates.astype('datetime64[M]').astype(np.int64)
+        first_month = months.min()
+        monthly_counts = np.bincount(months - first_month)
+        active = np.flatnonzero(monthly_counts)
+        labels = (active + first_month).astype('datetime64[M]')
+        return {str(month): int(count) for month, count in zip(labels, monthly_counts[active])}
+    
+    def _analyze_hourly_activity(self, dates: np.ndarray) -> Dict:
         
-        return dict(hourly_counts)
+        hours = (dates - dates.astype('datetime64[D]')).astype('timedelta64[h]').astype(np.int64)
+        hourly_counts = np.bincount(hours, minlength=24)
+        return {hour: int(count) for hour, count in enumerate(hourly_counts) if count}
     
-    def _analyze_sender_activity(self, messages: List[Dict]) -> Dict:
+    def _analyze_sender_activity(self, sender_ids: np.ndarray, sender_names: List[str]) -> Dict:
         
-        sender_counts = Counter(msg['sender'] for msg in messages)
+        message_counts = np.bincount(sender_ids, minlength=len(sender_names))
         
-        # Calculate statistics
-        message_counts = list(sender_counts.values())
+        # Stable sort keeps first-seen order among ties, like Counter.most_common
+        top = np.argsort(-message_counts, kind='stable')[:5]
         
         return {
-            'most_active': dict(sender_counts.most_common(5)),
+            'most_active': {sender_names[i]: int(message_counts[i]) for i in top},
             'message_distribution': {
-                'avg': np.mean(message_counts) if message_counts else 0,
-                'median': np.median(message_counts) if message_counts else 0,
-                'std': np.std(message_counts) if message_counts else 0
+                'avg': float(message_counts.mean()),
+                'median': float(np.median(message_counts)),
+                'std': float(message_counts.std())
             }
         }
     
-    def _analyze_response_patterns(self, messages: List[Dict]) -> Dict:
+    def _analyze_response_patterns(self, dates: np.ndarray, sender_ids: np.ndarray, bodies: List[str]) -> Dict:
         
-        response_times = []
-        question_messages = []
+        is_question = np.fromiter(
+            (self.question_re.search(body) is not None for body in bodies),
+            dtype=bool, count=len(bodies)
+        )
+        question_indices = np.flatnonzero(is_question)
+        total_questions = len(question_indices)
         
-        for i, msg in enumerate(messages):
-            if '?' in msg['message'] or any(word in msg['message'].lower() for word in ['help', 'doubt', 'how']):
-                question_messages.append((i, msg))
+        # Candidate replies are the next 5 messages; the first one from a
+        # different sender counts if it arrived within 2 hours
+        window = question_indices[:, None] + np.arange(1, 6)
+        in_range = window < len(bodies)
+        window = np.minimum(window, len(bodies) - 1)
+        other_sender = in_range & (sender_ids[window] != sender_ids[question_indices, None])
         
-        quick_responses = 0
-        total_questions = len(question_messages)
+        first_reply = window[np.arange(total_questions), other_sender.argmax(axis=1)]
+        minutes = dates.astype(np.int64)
+        time_diff = minutes[first_reply] - minutes[question_indices]
+        quick = other_sender.any(axis=1) & (time_diff < 120)
         
-        for q_idx, q_msg in question_messages:
-            # Check for responses within next 5 messages
-            for j in range(q_idx + 1, min(q_idx + 6, len(messages))):
-                if messages[j]['sender'] != q_msg['sender']:
-                    time_diff = messages[j]['date'] - q_msg['date']
-                    if time_diff < timedelta(hours=2):
-                        quick_responses += 1
-                        response_times.append(time_diff.total_seconds() / 60)  # in minutes
-                    break
+        quick_responses = int(quick.sum())
+        response_times = time_diff[quick].astype(np.float64)  # in minutes
         
         response_rate = (quick_responses / total_questions * 100) if total_questions > 0 else 0
         
@@ -221,7 +326,7 @@ class WhatsAppChatAnalyzer:
             'total_questions': total_questions,
             'quick_responses': quick_responses,
             'response_rate_percentage': response_rate,
-            'avg_response_time_minutes': np.mean(response_times) if response_times else 0
+            'avg_response_time_minutes': np.mean(response_times) if response_times.size else 0
         }
     
     def _calculate_engagement_score(self, total_messages: int, unique_senders: int, 
@@ -249,17 +354,30 @@ class WhatsAppChatAnalyzer:
         
         results = {}
         
-        for filename, club_info in self.club_mapping.items():
-            file_path = os.path.join(self.chat_dir, filename)
+        # Files are independent and the work is CPU-bound, so each one gets
+        # its own process; results are still collected in club_mapping order
+        with ProcessPoolExecutor(max_workers=min(len(self.club_mapping), os.cpu_count() or 1)) as executor:
+            pending = []
+            for filename, club_info in self.club_mapping.items():
+                file_path = os.path.join(self.chat_dir, filename)
+                
+                if os.path.exists(file_path):
+                    print(f"Analyzing chat for {club_info['name']}...")
+                    # Unchanged files are answered from the cache without a worker
+                    signature, analysis = _cached_analysis(file_path)
+                    future = executor.submit(self._analyze_chat_file, file_path) if analysis is None else None
+                    pending.append((club_info, file_path, signature, analysis, future))
+                else:
+                    print(f"Chat file not found: {filename}")
             
-            if os.path.exists(file_path):
-                print(f"Analyzing chat for {club_info['name']}...")
-                analysis = self.analyze_chat_file(file_path)
+            for club_info, file_path, signature, analysis, future in pending:
+                if future is not None:
+                    analysis = future.result()
+                    _store_analysis(file_path, signature, analysis)
+                analysis = dict(analysis)
                 analysis['club_id'] = club_info['id']
                 analysis['club_name'] = club_info['name']
                 results[f"club_{club_info['id']}"] = analysis
-            else:
-                print(f"Chat file not found: {filename}")
         
         return results
     
@@ -267,8 +385,16 @@ class WhatsAppChatAnalyzer:
         
         output_path = os.path.join(self.data_dir, output_file)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Hourly activity is keyed by int, hence OPT_NON_STR_KEYS
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         
         print(f"WhatsApp analysis saved to {output_path}")
         return output_path
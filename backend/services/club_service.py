@@ -1,28 +1,65 @@
 
 import json
 import os
-from typing import List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import numpy as np
+from pydantic import TypeAdapter
 from models.club import Club
 
+# orjson is optional; the stdlib json module covers the same calls more slowly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Validates the whole list in one call into pydantic-core rather than one
+# Club(**data) round-trip per row
+_CLUBS_ADAPTER = TypeAdapter(Tuple[Club, ...])
+
+@lru_cache(maxsize=1)
+def _load_clubs_cached(clubs_file: str, mtime: float) -> Tuple[Club, ...]:
+    # Keyed by mtime so an edited clubs.json is picked up; otherwise every
+    # ClubService shares one parsed, validated copy
+    with open(clubs_file, 'rb') as f:
+        raw = f.read()
+    clubs_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    return _CLUBS_ADAPTER.validate_python(clubs_data['clubs'])
+
 class ClubService:
     
     def __init__(self):
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
         self.clubs = self._load_clubs()
+        
+        # Lookup indexes, built once instead of scanning self.clubs per call
+        self._by_id = {}
+        self._by_category = defaultdict(list)
+        self._by_activity = defaultdict(list)
+        for club in self.clubs:
+            self._by_id.setdefault(club.id, club)
+            self._by_category[club.category].append(club)
+            for activity in dict.fromkeys(club.activities):
+                self._by_activity[activity].append(club)
+        
+        # Numeric columns for the statistics reductions
+        self._member_counts = np.fromiter((club.member_count for club in self.clubs), dtype=np.int64, count=len(self.clubs))
+        self._founded_years = np.fromiter((club.founded_year for club in self.clubs), dtype=np.int64, count=len(self.clubs))
+        
+        # Lower-cased searchable text per club. Fields are newline-separated
+        # so a query can't match across a name/description/keyword boundary
+        self._search_corpus = [
+            '\n'.join([club.name, club.description, *club.keywords]).lower()
+            for club in self.clubs
+        ]
     
     def _load_clubs(self) -> List[Club]:
 
         try:
             clubs_file = os.path.join(self.data_dir, 'clubs.json')
-            with open(clubs_file, 'r', encoding='utf-8') as f:
-                clubs_data = json.load(f)
-            
-            clubs = []
-            for club_data in clubs_data['clubs']:
-                club = Club(**club_data)
-                clubs.append(club)
-            
-            return clubs
+            return list(_load_clubs_cached(clubs_file, os.path.getmtime(clubs_file)))
         except Exception as e:
             print(f"Error loading clubs: {e}")
             return []
@@ -30,69 +67,36 @@ class ClubService:
     def get_all_clubs(self) -> List[Club]:
         return self.clubs
     
+    def count(self) -> int:
+        return len(self.clubs)
+    
     def get_club_by_id(self, club_id: int) -> Optional[Club]:
 
-        for club in self.clubs:
-            if club.id == club_id:
-                return club
-        return None
+        return self._by_id.get(club_id)
     
     def get_clubs_by_category(self, category: str) -> List[Club]:
 
-        return [club for club in self.clubs if club.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_clubs_by_activity(self, activity: str) -> List[Club]:
 
-        return [club for club in self.clubs if activity in club.activities]
+        return list(self._by_activity.get(activity, ()))
     
     def search_clubs_by_keyword(self, keyword: str) -> List[Club]:
 
         keyword_lower = keyword.lower()
-        matching_clubs = []
-        
-        for club in self.clubs:
-            # Check name
-            if keyword_lower in club.name.lower():
-                matching_clubs.append(club)
-                continue
-            
-            # Check description
-            if keyword_lower in club.description.lower():
-                matching_clubs.append(club)
-                continue
-            
-            # Check keywords
-            if any(keyword_lower in kw.lower() for kw in club.keywords):
-                matching_clubs.append(club)
-                continue
-        
-        return matching_clubs
+        return [club for club, text in zip(self.clubs, self._search_corpus) if keyword_lower in text]
     
     def get_club_statistics(self) -> dict:
 
         if not self.clubs:
             return {}
         
-        categories = {}
-        total_members = 0
-        oldest_year = float('inf')
-        newest_year = 0
-        
-        for club in self.clubs:
-            # Count by category
-            if club.category in categories:
-                categories[club.category] += 1
-            else:
-                categories[club.category] = 1
-            
-            # Sum members
-            total_members += club.member_count
-            
-            # Track founding years
-            if club.founded_year < oldest_year:
-                oldest_year = club.founded_year
-            if club.founded_year > newest_year:
-                newest_year = club.founded_year
+        # Category buckets are already built, in first-seen order
+        categories = {category: len(clubs) for category, clubs in self._by_category.items()}
+        total_members = int(self._member_counts.sum())
+        oldest_year = int(self._founded_years.min())
+        newest_year = int(self._founded_years.max())
         
         return {
             "total_clubs": len(self.clubs),
@@ -1,5 +1,8 @@
 import json
 import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 import numpy as np
 
@@ -7,19 +10,57 @@ from models.club import Club, ClubRanking, EvaluationMetrics, Event, SocialMedia
 from services.club_service import ClubService
 from services.grouping_service import ClubGroupingService
 
+# orjson is optional; the stdlib json module covers the same calls more slowly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=8)
+def _read_json_cached(path: str, mtime: float):
+    # Keyed by mtime so an edited file is re-read; otherwise every service
+    # instance shares one parse. Callers must treat the result as read-only
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _read_json(path: str):
+    return _read_json_cached(path, os.path.getmtime(path))
+
+def _group_by_club(rows) -> Dict[int, list]:
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.club_id].append(row)
+    return dict(grouped)
+
 class ClubEvaluationService:
 
     
-    def __init__(self):
-        self.club_service = ClubService()
-        self.grouping_service = ClubGroupingService()
+    def __init__(self, club_service: Optional[ClubService] = None,
+                 grouping_service: Optional[ClubGroupingService] = None):
+        self.club_service = club_service or ClubService()
+        self.grouping_service = grouping_service or ClubGroupingService(self.club_service)
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
         
-        # Load all data
-        self.events = self._load_events()
-        self.social_media_metrics = self._load_social_media_metrics()
-        self.whatsapp_activity = self._load_whatsapp_activity()
-        self.voting_data = self._load_voting_data()
+        # Load all data; the files are independent, so their reads overlap
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            events, social_media_metrics, whatsapp_activity, voting_data = [
+                executor.submit(loader) for loader in (
+                    self._load_events,
+                    self._load_social_media_metrics,
+                    self._load_whatsapp_activity,
+                    self._load_voting_data
+                )
+            ]
+        self.events = events.result()
+        self.social_media_metrics = social_media_metrics.result()
+        self.whatsapp_activity = whatsapp_activity.result()
+        self.voting_data = voting_data.result()
+        
+        # Per-club views of the rows above, so lookups don't rescan every list
+        self._events_by_club = _group_by_club(self.events)
+        self._social_media_by_club = _group_by_club(self.social_media_metrics)
+        self._whatsapp_by_club = _group_by_club(self.whatsapp_activity)
         
         # Evaluation weights for different metrics
         self.weights = {
@@ -29,13 +70,17 @@ class ClubEvaluationService:
             "collaboration": 0.15,
             "voting": 0.1
         }
+        
+        # club_id -> EvaluationMetrics for every known club, built on first use
+        self._metrics_by_club: Optional[Dict[int, EvaluationMetrics]] = None
+        # Overall rankings derive only from the data above, so they're built once
+        self._overall_rankings: Optional[List[ClubRanking]] = None
     
     def _load_events(self) -> List[Event]:
 
         try:
             events_file = os.path.join(self.data_dir, 'events.json')
-            with open(events_file, 'r', encoding='utf-8') as f:
-                events_data = json.load(f)
+            events_data = _read_json(events_file)
             
             events = []
             for event_data in events_data['events']:
@@ -51,8 +96,7 @@ class ClubEvaluationService:
  
         try:
             sm_file = os.path.join(self.data_dir, 'social_media_metrics.json')
-            with open(sm_file, 'r', encoding='utf-8') as f:
-                sm_data = json.load(f)
+            sm_data = _read_json(sm_file)
             
             metrics = []
             for metric_data in sm_data['social_media_metrics']:
@@ -68,8 +112,7 @@ class ClubEvaluationService:
 
         try:
             wa_file = os.path.join(self.data_dir, 'whatsapp_activity.json')
-            with open(wa_file, 'r', encoding='utf-8') as f:
-                wa_data = json.load(f)
+            wa_data = _read_json(wa_file)
             
             activities = []
             for activity_data in wa_data['whatsapp_activity']:
@@ -85,8 +128,7 @@ class ClubEvaluationService:
 
         try:
             voting_file = os.path.join(self.data_dir, 'voting_data.json')
-            with open(voting_file, 'r', encoding='utf-8') as f:
-                voting_data = json.load(f)
+            voting_data = _read_json(voting_file)
             
             return voting_data
         except Exception as e:
@@ -95,7 +137,11 @@ class ClubEvaluationService:
     
     def calculate_club_metrics(self, club_id: int) -> EvaluationMetrics:
 
+        metrics = self._score_table().get(club_id)
+        if metrics is not None:
+            return metrics
         
+        # Clubs outside club_service are scored one at a time
         # Calculate individual metric scores
         social_media_score = self._calculate_social_media_score(club_id)
         event_impact_score = self._calculate_event_impact_score(club_id)
@@ -122,8 +168,109 @@ class ClubEvaluationService:
             overall_score=overall_score
         )
     
+    def _score_table(self) -> Dict[int, EvaluationMetrics]:
+        
+        if self._metrics_by_club is None:
+            self._metrics_by_club = self._build_score_table()
+        return self._metrics_by_club
+    
+    def _build_score_table(self) -> Dict[int, EvaluationMetrics]:
+        # Scores every club in one columnar pass: each data set becomes a few
+        # NumPy columns plus the row's club position, and per-club sums and
+        # means are np.bincount reductions. Same arithmetic, in the same order,
+        # as the per-club _calculate_* methods
+        club_ids = list(dict.fromkeys(club.id for club in self.club_service.get_all_clubs()))
+        n = len(club_ids)
+        if n == 0:
+            return {}
+        position = {club_id: i for i, club_id in enumerate(club_ids)}
+        
+        def positions(rows) -> np.ndarray:
+            return np.fromiter((position.get(row.club_id, -1) for row in rows), dtype=np.intp, count=len(rows))
+        
+        def column(rows, attr: str) -> np.ndarray:
+            return np.fromiter((getattr(row, attr) for row in rows), dtype=np.float64, count=len(rows))
+        
+        def per_club_sum(pos: np.ndarray, values: Optional[np.ndarray] = None) -> np.ndarray:
+            known = pos >= 0
+            weights = values[known] if values is not None else None
+            return np.bincount(pos[known], weights=weights, minlength=n).astype(np.float64)
+        
+        def per_club_mean(pos: np.ndarray, values: np.ndarray) -> np.ndarray:
+            counts = per_club_sum(pos)
+            totals = per_club_sum(pos, values)
+            return np.divide(totals, counts, out=np.zeros(n), where=counts > 0)
+        
+        # Social media
+        sm_pos = positions(self.social_media_metrics)
+        collaboration_posts = column(self.social_media_metrics, 'collaboration_posts')
+        platform_scores = (
+            np.minimum(column(self.social_media_metrics, 'engagement_rate'), 10.0) +
+            np.minimum(column(self.social_media_metrics, 'posts_last_month') / 5.0, 10.0) +
+            np.minimum(collaboration_posts * 2.0, 10.0)
+        ) / 3.0
+        social_media = np.minimum(per_club_mean(sm_pos, platform_scores), 10.0)
+        
+        # Event impact
+        ev_pos = positions(self.events)
+        event_scores = (
+            column(self.events, 'impact_score') * 0.5 +
+            np.minimum(column(self.events, 'participants') / 50.0, 10.0) * 0.3 +
+            np.minimum(column(self.events, 'duration_hours') / 8.0, 10.0) * 0.2
+        )
+        event_impact = np.minimum(per_club_mean(ev_pos, event_scores), 10.0)
+        
+        # Community engagement
+        wa_pos = positions(self.whatsapp_activity)
+        community = np.minimum(per_club_mean(wa_pos, column(self.whatsapp_activity, 'engagement_score')), 10.0)
+        
+        # Collaboration
+        is_collaborative = np.fromiter((bool(e.collaboration_clubs) for e in self.events), dtype=bool, count=len(self.events))
+        collaboration = (
+            np.minimum(per_club_sum(ev_pos[is_collaborative]) * 2.0, 10.0) +
+            np.minimum(per_club_sum(sm_pos, collaboration_posts) * 1.0, 10.0) +
+            np.minimum(per_club_sum(wa_pos, column(self.whatsapp_activity, 'collaboration_messages')) / 5.0, 10.0)
+        ) / 3.0
+        
+        # Voting
+        voting = np.full(n, 5.0)
+        if self.voting_data and 'vote_summary' in self.voting_data:
+            vote_summary = self.voting_data['vote_summary']
+            categories = vote_summary.get('categories', {})
+            total_votes = vote_summary.get('total_votes', 1)
+            if categories:
+                keys = [str(club_id) for club_id in club_ids]
+                total = np.zeros(n)
+                for votes in categories.values():
+                    club_votes = np.array([votes.get(key, 0) for key in keys], dtype=np.float64)
+                    total += np.minimum((club_votes / total_votes) * 100.0 * 2.0, 10.0)
+                voting = total / len(categories)
+        
+        overall = (
+            social_media * self.weights["social_media"] +
+            event_impact * self.weights["event_impact"] +
+            community * self.weights["community_engagement"] +
+            collaboration * self.weights["collaboration"] +
+            voting * self.weights["voting"]
+        )
+        
+        columns = zip(club_ids, social_media.tolist(), event_impact.tolist(), community.tolist(),
+                      collaboration.tolist(), voting.tolist(), overall.tolist())
+        return {
+            club_id: EvaluationMetrics(
+                club_id=club_id,
+                social_media_score=sm,
+                event_impact_score=ev,
+                community_engagement_score=ce,
+                collaboration_score=co,
+                voting_score=vo,
+                overall_score=ov
+            )
+            for club_id, sm, ev, ce, co, vo, ov in columns
+        }
+    
     def _calculate_social_media_score(self, club_id: int) -> float:
-        club_metrics = [m for m in self.social_media_metrics if m.club_id == club_id]
+        club_metrics = self._social_media_by_club.get(club_id, [])
         
         if not club_metrics:
             return 0.0
@@ -141,7 +288,7 @@ class ClubEvaluationService:
         return min(total_score / len(club_metrics), 10.0)
     
     def _calculate_event_impact_score(self, club_id: int) -> float:
-        club_events = [e for e in self.events if e.club_id == club_id]
+        club_events = self._events_by_club.get(club_id, [])
         
         if not club_events:
             return 0.0
@@ -159,7 +306,7 @@ class ClubEvaluationService:
         return min(total_score / len(club_events), 10.0)
     
     def _calculate_community_engagement_score(self, club_id: int) -> float:
-        club_activities = [w for w in self.whatsapp_activity if w.club_id == club_id]
+        club_activities = self._whatsapp_by_club.get(club_id, [])
         
         if not club_activities:
             return 0.0
@@ -173,16 +320,16 @@ class ClubEvaluationService:
     
     def _calculate_collaboration_score(self, club_id: int) -> float:
         # Count collaborative events
-        collaborative_events = [e for e in self.events if e.club_id == club_id and e.collaboration_clubs]
+        collaborative_events = [e for e in self._events_by_club.get(club_id, []) if e.collaboration_clubs]
         
         # Count collaborative social media posts
         collaborative_posts = sum(
-            m.collaboration_posts for m in self.social_media_metrics if m.club_id == club_id
+            m.collaboration_posts for m in self._social_media_by_club.get(club_id, [])
         )
         
         # Count collaborative WhatsApp messages
         collaborative_messages = sum(
-            w.collaboration_messages for w in self.whatsapp_activity if w.club_id == club_id
+            w.collaboration_messages for w in self._whatsapp_by_club.get(club_id, [])
         )
         
         # Calculate score based on collaboration frequency
@@ -216,26 +363,13 @@ class ClubEvaluationService:
     
     def get_overall_rankings(self) -> List[ClubRanking]:
 
-        clubs = self.club_service.get_all_clubs()
-        rankings = []
-        
-        for club in clubs:
-            metrics = self.calculate_club_metrics(club.id)
-            ranking = ClubRanking(
-                rank=0,  # Will be set after sorting
-                club=club,
-                metrics=metrics
-            )
-            rankings.append(ranking)
-        
-        # Sort by overall score (descending)
-        rankings.sort(key=lambda x: x.metrics.overall_score, reverse=True)
-        
-        # Set ranks
-        for i, ranking in enumerate(rankings):
-            ranking.rank = i + 1
-        
-        return rankings
+        if self._overall_rankings is None:
+            self._overall_rankings = self._rank_all_clubs()
+        return list(self._overall_rankings)
+    
+    def _rank_all_clubs(self) -> List[ClubRanking]:
+
+        return self._rank_clubs(self.club_service.get_all_clubs())
     
     def get_group_rankings(self, group_name: str) -> List[ClubRanking]:
 
@@ -243,29 +377,30 @@ class ClubEvaluationService:
         if not group:
             return []
         
-        rankings = []
-        for club in group.clubs:
-            metrics = self.calculate_club_metrics(club.id)
-            ranking = ClubRanking(
-                rank=0,  # Will be set after sorting
-                club=club,
-                metrics=metrics,
+        return self._rank_clubs(group.clubs, group_name)
+    
+    def _rank_clubs(self, clubs: List[Club], group_name: Optional[str] = None) -> List[ClubRanking]:
+
+        metrics = [self.calculate_club_metrics(club.id) for club in clubs]
+        
+        # Descending by overall score; the stable sort keeps ties in input
+        # order, same as list.sort(reverse=True)
+        overall = np.fromiter((m.overall_score for m in metrics), dtype=np.float64, count=len(metrics))
+        order = np.argsort(-overall, kind='stable')
+        
+        return [
+            ClubRanking(
+                rank=rank,
+                club=clubs[i],
+                metrics=metrics[i],
                 group_name=group_name
             )
-            rankings.append(ranking)
-        
-        # Sort by overall score (descending)
-        rankings.sort(key=lambda x: x.metrics.overall_score, reverse=True)
-        
-        # Set ranks
-        for i, ranking in enumerate(rankings):
-            ranking.rank = i + 1
-        
-        return rankings
+            for rank, i in enumerate(order.tolist(), start=1)
+        ]
     
     def get_social_media_analytics(self, club_id: int) -> Dict:
        
-        club_metrics = [m for m in self.social_media_metrics if m.club_id == club_id]
+        club_metrics = self._social_media_by_club.get(club_id, [])
         
         analytics = {
             "total_followers": sum(m.followers for m in club_metrics),
@@ -288,7 +423,7 @@ class ClubEvaluationService:
     
     def get_event_analytics(self, club_id: int) -> Dict:
 
-        club_events = [e for e in self.events if e.club_id == club_id]
+        club_events = self._events_by_club.get(club_id, [])
         
         if not club_events:
             return {"total_events": 0}
@@ -297,17 +432,14 @@ class ClubEvaluationService:
             "total_events": len(club_events),
             "total_participants": sum(e.participants for e in club_events),
             "avg_impact_score": np.mean([e.impact_score for e in club_events]),
-            "collaborative_events": len([e for e in club_events if e.collaboration_clubs]),
-            "event_types": {
-                event_type: len([e for e in club_events if e.type == event_type])
-                for event_type in set(e.type for e in club_events)
-            },
+            "collaborative_events": sum(1 for e in club_events if e.collaboration_clubs),
+            "event_types": dict(Counter(e.type for e in club_events)),
             "recent_events": sorted(club_events, key=lambda x: x.date, reverse=True)[:5]
         }
     
     def get_whatsapp_analytics(self, club_id: int) -> Dict:
 
-        club_activities = [w for w in self.whatsapp_activity if w.club_id == club_id]
+        club_activities = self._whatsapp_by_club.get(club_id, [])
         
         if not club_activities:
             return {"total_months": 0}
@@ -319,7 +451,7 @@ class ClubEvaluationService:
             "avg_engagement_score": np.mean([w.engagement_score for w in club_activities]),
             "total_event_discussions": sum(w.event_discussions for w in club_activities),
             "total_help_requests": sum(w.help_requests for w in club_activities),
-            "monthly_data": club_activities
+            "monthly_data": list(club_activities)
         }
     
     def get_voting_summary(self) -> Dict:
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.cluster import KMeans
 from sklearn.metrics.pairwise import cosine_similarity
@@ -12,8 +12,9 @@ from services.club_service import ClubService
 class ClubGroupingService:
     
     
-    def __init__(self):
-        self.club_service = ClubService()
+    def __init__(self, club_service: Optional[ClubService] = None):
+        # Reuse the caller's ClubService so clubs.json is only parsed once
+        self.club_service = club_service or ClubService()
         self.clubs = self.club_service.get_all_clubs()
         
         # Define predefined group mappings for better categorization